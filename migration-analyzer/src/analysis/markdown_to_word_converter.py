@@ -14,8 +14,6 @@ try:
     from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_COLOR_INDEX
     from docx.enum.style import WD_STYLE_TYPE
     from docx.oxml.shared import OxmlElement, qn
-    from docx.oxml.ns import nsdecls
-    from docx.oxml import parse_xml
     from docx.enum.table import WD_TABLE_ALIGNMENT
     HAS_DOCX = True
 except ImportError:
@@ -253,8 +251,10 @@ class MarkdownToWordConverter:
             cell.text = header
             cell.paragraphs[0].runs[0].font.bold = True
             cell.paragraphs[0].runs[0].font.color.rgb = RGBColor(255, 255, 255)
-            # Add light blue background
-            cell._tc.get_or_add_tcPr().append(parse_xml(f'<w:shd {nsdecls("w")} w:fill="4472C4"/>'))
+            # Add light blue background (built as an element, no XML string round-trip)
+            shading = OxmlElement('w:shd')
+            shading.set(qn('w:fill'), '4472C4')
+            cell._tc.get_or_add_tcPr().append(shading)
         
         # Add data rows
         for row_idx, row_data in enumerate(data):